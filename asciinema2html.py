@@ -1,16 +1,22 @@
 import logging
 import sys
-import copy
 import shutil
 import json
-import base64
 import re
-from os.path import dirname, exists, realpath
+from bisect import bisect_right
+from os.path import dirname, exists, join, realpath
 from os import makedirs
 
-from terminal2html import VT2Html, HtmlDocumentCreator as VT2HtmlDocCreator
+from terminal2html import VT2Html, HtmlDocumentCreator as VT2HtmlDocCreator, OUTPUT_BUFFER_SIZE, INPUT_BUFFER_SIZE, parse_lines
 from terminalparser import TermLogParser
 from vtparser import VT500Parser
+from jsonloader import json_loads
+
+# The SIMD accelerated pybase64 is used for encoding vim sessions when it is available.
+try:
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
 
 
 LOG = logging.getLogger()
@@ -55,12 +61,44 @@ class HtmlDocumentCreator(VT2HtmlDocCreator):
   <script src="{acpdir}/v{acpver}/asciinema-player.js"></script>
 """
 
+    VIM_SESSION_INTRO = ('      <details class="vimsession-dropdown">\n'
+                         '        <summary><span class="vim-session">  [==-- Vim editor session --==]</span></summary>\n'
+                         '        <div class="vimsession-player-wrapper">\n')
+
+    VIM_SESSION_OUTRO = ('        </div>\n'
+                         '      </details>\n')
+
+    CONTROLS_HELP_V2 = ('          <div class="controls-help vim-session">\n'
+                        '  Controls: \n'
+                        '    space       - play / pause \n'
+                        '    < / >       - de- / increase playback speed\n'
+                        '    ← / →       - rewind / fast-forward 5 seconds\n'
+                        '    0, 1, ... 9 - jump to 0%, 10%, ... 90%\n'
+                        '          </div>\n')
+
+    CONTROLS_HELP_V3 = ('          <div class="controls-help vim-session">\n'
+                        '  Controls: \n'
+                        '    space  - play / pause\n'
+                        '    .      - step through a recording one frame at a time (when paused)\n'
+                        '    < / >  - decrease / increase playback speed\n'
+                        '    ← / →  - rewind 5 seconds / fast-forward 5 seconds\n'
+                        '    Shift + ← / Shift + → - rewind by 10% / fast-forward by 10%\n'
+                        '    0, 1, 2 ... 9         - jump to 0%, 10%, 20% ... 90%\n'
+                        '          </div>\n')
+
 
     def __init__(self, out_fh=sys.stdout, palette="MyDracula", dark_bg=True, title=None, chapters={}, cmd_filter=[], hopto=None, review=False):
-        super().HEAD_ELEMS['asciinema'] = [self.STYLE_DROPDOWN,
-                                           self.STYLE_ASCIINEMA.format(acpdir=ACP_DIR, acpver=ACP_VER),
-                                           self.SCRIPT_ASCIINEMA.format(acpdir=ACP_DIR, acpver=ACP_VER) ]
+        # Add our head elements to a copy, so that the class attribute of the parent class is left untouched
+        self.HEAD_ELEMS = {**self.HEAD_ELEMS,
+                           'asciinema': [self.STYLE_DROPDOWN,
+                                         self.STYLE_ASCIINEMA.format(acpdir=ACP_DIR, acpver=ACP_VER),
+                                         self.SCRIPT_ASCIINEMA.format(acpdir=ACP_DIR, acpver=ACP_VER)]}
         super().__init__(out_fh, palette, dark_bg, title, chapters, cmd_filter, hopto)
+        # The player version doesn't change while writing a document, so select its insert method once
+        if ACP_VER == 2:
+            self.insert_vim_session_player = self.insert_vim_session_player_v2
+        else:
+            self.insert_vim_session_player = self.insert_vim_session_player_v3
         self.ddcount = 0
         self.vimsessions = {}
         self.review_mode = review
@@ -86,18 +124,18 @@ class HtmlDocumentCreator(VT2HtmlDocCreator):
 
         if self.review_mode:
             # Add the frame number so we can match with the hop links during review
-            self.fh.write('  <div class="review-frame-ts">{:f}</div>\n'.format(self.frame_ts))
+            self.out(f'  <div class="review-frame-ts">{self.frame_ts:f}</div>\n')
 
         self.start_new_cmd_row()
 
 
     def add_review_hopto(self):
-        if self.hopto['rev_hops'][self.current_rev_hop][0] <= self.frame_ts:
-            LOG.debug("At ts %f detected previous jump from %f to %f", self.frame_ts, self.hopto['rev_hops'][self.current_rev_hop][0], self.hopto['rev_hops'][self.current_rev_hop][1])
-            self.fh.write('\n  <div class="review-cmd-hop">\n')
-            self.fh.write('    before TS {} detected jump to {}\n'
-                          .format(self.frame_ts, self.hopto['rev_hops'][self.current_rev_hop][1]))
-            self.fh.write('  </div>\n\n')
+        hop_from, hop_to = self.hopto['rev_hops'][self.current_rev_hop]
+        if hop_from <= self.frame_ts:
+            LOG.debug("At ts %f detected previous jump from %f to %f", self.frame_ts, hop_from, hop_to)
+            self.out('\n  <div class="review-cmd-hop">\n'
+                     f'    before TS {self.frame_ts} detected jump to {hop_to}\n'
+                     '  </div>\n\n')
             self.current_rev_hop += 1
 
 
@@ -107,77 +145,67 @@ class HtmlDocumentCreator(VT2HtmlDocCreator):
             return
         self.end_cmd_block()
 
-        self.fh.write('      <details class="vimsession-dropdown">\n')
-        self.fh.write('        <summary><span class="vim-session">  [==-- Vim editor session --==]</span></summary>\n')
-        self.fh.write('        <div class="vimsession-player-wrapper">\n')
-
-        session_id = str(self.ddcount) + '_' + str(self.cmd_number)
+        session_id = f'{self.ddcount}_{self.cmd_number}'
         if vimrecording is not None:
-            if ACP_VER == 2:
-                self.insert_vim_session_player_v2(vimrecording, session_id)
-            else:
-                self.insert_vim_session_player_v3(vimrecording, session_id)
-            self.vimsessions[session_id] = vimrecording.to_string()
+            # Serialize the recording only once, for the player and for dumping the session later
+            vimsession = vimrecording.to_string()
+            player = self.insert_vim_session_player(vimrecording, vimsession, session_id)
+            self.vimsessions[session_id] = vimsession
         else:
-            self.fh.write('          <span class="vim-session">     [==-- THIS SHOULD BE A DROPDOWN ASCIINEMA RECORDING --==]</span>\n')
+            player = ['          <span class="vim-session">     [==-- THIS SHOULD BE A DROPDOWN ASCIINEMA RECORDING --==]</span>\n']
 
-        self.fh.write('        </div>\n')
-        self.fh.write('      </details>\n')
+        # Write the whole session block in one go. The fragments are not joined,
+        # so that the potentially large recording payload is not copied again.
+        # Buffered output goes first, so that the session lands after the text before it.
+        self.flush_out()
+        self.fh.writelines([self.VIM_SESSION_INTRO, *player, self.VIM_SESSION_OUTRO])
         self.ddcount += 1
 
         self.start_cmd_block()
 
 
-    def insert_vim_session_player_v2(self, vimrecording, session_id):
-        vimsession = vimrecording.to_string()
-        acbase64 = base64.b64encode(vimsession.encode("utf-8"))
-        self.fh.write('          <div>\n')
-        self.fh.write('            <asciinema-player idle-time-limit="3" speed="1.75" poster="' + self.get_poster(vimrecording) + '" ')
-        self.fh.write(                              'cols="{:d}" rows="{:d}" '.format(vimrecording.asciinfo['width'], vimrecording.asciinfo['height']))
-        self.fh.write(                              'src="data:application/json;base64,' + acbase64.decode("ascii") + '" />\n')
-        self.fh.write('          </div>\n')
-        self.fh.write('          <div class="controls-help vim-session">\n')
-        self.fh.write('  Controls: \n')
-        self.fh.write('    space       - play / pause \n')
-        self.fh.write('    < / >       - de- / increase playback speed\n')
-        self.fh.write('    ← / →       - rewind / fast-forward 5 seconds\n')
-        self.fh.write('    0, 1, ... 9 - jump to 0%, 10%, ... 90%\n')
-        self.fh.write('          </div>\n')
+    def insert_vim_session_player_v2(self, vimrecording, vimsession, session_id):
+        """ Return the HTML fragments for an asciinema player v2 element playing the vim session """
+        acbase64 = b64encode(vimsession.encode("utf-8")).decode("ascii")
+        html = ['          <div>\n'
+                f'            <asciinema-player idle-time-limit="3" speed="1.75" poster="{self.get_poster(vimrecording)}" '
+                f'cols="{vimrecording.asciinfo["width"]:d}" rows="{vimrecording.asciinfo["height"]:d}" '
+                'src="data:application/json;base64,',
+                acbase64,
+                '" />\n'
+                '          </div>\n',
+                self.CONTROLS_HELP_V2]
         if self.review_mode:
-            self.fh.write('          <input class="vimsession-dump" id="ddcheck'  + str(self.ddcount) + '" type="checkbox" name="asciinema"/>\n')
-            self.fh.write('          <label class="vimsession-dump" for="ddcheck' + str(self.ddcount) + '">Show Vim editor session dump</label>\n')
-            self.fh.write('          <pre class="vimsession-dump">\n')
-            self.fh.write(vimsession + '\n')
-            self.fh.write('          </pre>\n')
-
-    def insert_vim_session_player_v3(self, vimrecording, session_id):
-        vimsession = vimrecording.to_string()
-        acbase64 = base64.b64encode(vimsession.encode("utf-8"))
-        self.fh.write('          <div id="vimsess_' + session_id + '"></div>\n')
-        self.fh.write('          <div class="controls-help vim-session">\n')
-        self.fh.write('  Controls: \n')
-        self.fh.write('    space  - play / pause\n')
-        self.fh.write('    .      - step through a recording one frame at a time (when paused)\n')
-        self.fh.write('    < / >  - decrease / increase playback speed\n')
-        self.fh.write('    ← / →  - rewind 5 seconds / fast-forward 5 seconds\n')
-        self.fh.write('    Shift + ← / Shift + → - rewind by 10% / fast-forward by 10%\n')
-        self.fh.write('    0, 1, 2 ... 9         - jump to 0%, 10%, 20% ... 90%\n')
-        self.fh.write('          </div>\n')
+            html += [f'          <input class="vimsession-dump" id="ddcheck{self.ddcount}" type="checkbox" name="asciinema"/>\n'
+                     f'          <label class="vimsession-dump" for="ddcheck{self.ddcount}">Show Vim editor session dump</label>\n'
+                     '          <pre class="vimsession-dump">\n',
+                     vimsession,
+                     '\n'
+                     '          </pre>\n']
+        return html
+
+    def insert_vim_session_player_v3(self, vimrecording, vimsession, session_id):
+        """ Return the HTML fragments for an asciinema player v3 element playing the vim session """
+        acbase64 = b64encode(vimsession.encode("utf-8")).decode("ascii")
+        html = [f'          <div id="vimsess_{session_id}"></div>\n',
+                self.CONTROLS_HELP_V3]
         if self.review_mode:
-            self.fh.write('      <input class="vimsession-dump" id="ddcheck'  + str(self.ddcount) + '" type="checkbox" name="asciinema"/>\n')
-            self.fh.write('      <label class="vimsession-dump" for="ddcheck' + str(self.ddcount) + '">Show Vim editor session dump</label>\n')
-        self.fh.write('          <pre  class="vimsession-dump" id="vimsess_' + session_id + '_dump">[\n')
-        self.fh.write(vimsession.replace('\n', ',\n') + '\n')
-        self.fh.write(']         </pre>\n')
-        self.fh.write('          <script>\n')
-        self.fh.write("            AsciinemaPlayer.create('data:text/plain;base64," + acbase64.decode("ascii") + "', \n")
-        self.fh.write("                                   document.getElementById('vimsess_" + session_id + "'), {\n")
-        self.fh.write("                                      cols: {:d} , rows: {:d}, fit: false,\n"
-                      .format(vimrecording.asciinfo['width'], vimrecording.asciinfo['height']))
-        self.fh.write("                                      idleTimeLimit: 3, speed: 1.75, poster: '{:s}'\n"
-                      .format(self.get_poster(vimrecording)))
-        self.fh.write("                                   });\n")
-        self.fh.write('          </script>\n')
+            html.append(f'      <input class="vimsession-dump" id="ddcheck{self.ddcount}" type="checkbox" name="asciinema"/>\n'
+                        f'      <label class="vimsession-dump" for="ddcheck{self.ddcount}">Show Vim editor session dump</label>\n')
+        html += [f'          <pre  class="vimsession-dump" id="vimsess_{session_id}_dump">[\n',
+                 vimsession.replace('\n', ',\n'),
+                 '\n'
+                 ']         </pre>\n'
+                 '          <script>\n'
+                 "            AsciinemaPlayer.create('data:text/plain;base64,",
+                 acbase64,
+                 "', \n"
+                 f"                                   document.getElementById('vimsess_{session_id}'), {{\n"
+                 f"                                      cols: {vimrecording.asciinfo['width']:d} , rows: {vimrecording.asciinfo['height']:d}, fit: false,\n"
+                 f"                                      idleTimeLimit: 3, speed: 1.75, poster: '{self.get_poster(vimrecording):s}'\n"
+                 "                                   });\n"
+                 '          </script>\n']
+        return html
 
 
     def get_poster(self, vimrecording):
@@ -190,43 +218,48 @@ class HtmlDocumentCreator(VT2HtmlDocCreator):
 
 
     def dump_vim_sessions(self, path):
-        if not exists(path):
-            makedirs(path)
+        makedirs(path, exist_ok=True)
         for sessnum, session in self.vimsessions.items():
-            with open(path + "/vim_session_" + sessnum + ".rec", mode='w', encoding="utf-8") as sessfile:
+            with open(join(path, f"vim_session_{sessnum}.rec"), mode='w', encoding="utf-8") as sessfile:
                 sessfile.write(session)
-                sessfile.close()
 
 
 class VimRecording:
     """
     Recording a Vim session in a asciinema recording
     """
+
+    # Time span quantization steps, in ascending order
+    QUANTIZE_STEPS = (0.03, 0.1, 0.18, 0.3, 0.5, 1.0, 2.0, 4.0)
+
     def __init__(self, asciinfo):
         self.asciinfo = asciinfo
         self.last_ts = 0.0
+        self.last_rel_ts = 0.0
 
     def start(self, start_ts, height = -1):
         self.last_ts = start_ts
+        self.last_rel_ts = 0.0
         if (height >= 0):
             if height != self.asciinfo["height"]:
                 LOG.debug("VimRecording:: Start vim recording at ts %s with height %s (overriding default %s)", start_ts, height, self.asciinfo["height"])
-                asciinfo = copy.deepcopy(self.asciinfo)
-                asciinfo["height"] = height
+                asciinfo = {**self.asciinfo, "height": height}
             else:
                 LOG.debug("VimRecording:: Start vim recording at ts %s with height %s", start_ts, height)
                 asciinfo = self.asciinfo
         else:
             LOG.debug("VimRecording:: Start vim recording at ts %s with default height %s", start_ts, self.asciinfo["height"])
             asciinfo = self.asciinfo
-        LOG.debug("VimRecording:: asciinfo: '%s'", json.dumps(asciinfo))
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("VimRecording:: asciinfo: '%s'", json.dumps(asciinfo))
         self.frames = [asciinfo]
         self.frames.append([0.0000, "o", "Start at " + str(start_ts) + "\r\n"])
 
     def quantize_ts(self, ts):
-        for qstep in [4.0, 2.0, 1.0, 0.5, 0.3, 0.18, 0.1, 0.03]:
-            if ts >= qstep:
-                return qstep
+        # Round down to the next lower quantization step. Time spans below the smallest step are kept as they are.
+        idx = bisect_right(self.QUANTIZE_STEPS, ts)
+        if idx:
+            return self.QUANTIZE_STEPS[idx - 1]
         return ts
 
     def frame_time(self, ts):
@@ -234,28 +267,29 @@ class VimRecording:
         ts_diff = ts - self.last_ts
         # Quantize time span
         ts_diff = self.quantize_ts(ts_diff)
-        # Timestamp of last saved frame
-        ts_prev = self.frames[-1][0] if len(self.frames) > 1 else 0.0
-        # New timestamp relative to last one
-        rel_ts = ts_prev + ts_diff
-        # Save seen frame time
+        # New timestamp relative to the timestamp of the last saved frame
+        rel_ts = round(self.last_rel_ts + ts_diff, 5)
+        # Save seen frame time and the saved frame's relative time
         self.last_ts = ts
-        return round(rel_ts, 5)
+        self.last_rel_ts = rel_ts
+        return rel_ts
 
     def add(self, frame):
-        LOG.debug("VimRecording:: Add frame at ts %s", frame[0])
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("VimRecording:: Add frame at ts %s", frame[0])
         self.frames.append([self.frame_time(frame[0]), frame[1], frame[2]])
 
     def addall(self, frames):
-        LOG.debug("VimRecording:: Add frames at ts %s - %s", frames[0][0], frames[-1][0])
-        for f in frames:
-            self.frames.append([self.frame_time(f[0]), f[1], f[2]])
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug("VimRecording:: Add frames at ts %s - %s", frames[0][0], frames[-1][0])
+        frame_time = self.frame_time
+        self.frames.extend([[frame_time(f[0]), f[1], f[2]] for f in frames])
 
     def get_end_time(self):
         return self.frames[-1][0]
 
     def to_string(self):
-        return '\n'.join(json.dumps(f) for f in self.frames)
+        return '\n'.join(map(json.dumps, self.frames))
 
 
 class Asciinema2Html(VT2Html, VT500Parser.DefaultTerminalOutputHandler, VT500Parser.DefaultControlSequenceHandler,
@@ -266,21 +300,31 @@ class Asciinema2Html(VT2Html, VT500Parser.DefaultTerminalOutputHandler, VT500Par
     Vim sessions are suppressed. In a later instance they could be added as asciinema inserts.
     """
 
+    # Either of the vim session end patterns, so that a frame is scanned only once.
+    # The leading '.*' of the patterns is only needed for matching at the line start. Searching without it
+    # lets the regex engine scan for the escape sequences directly, instead of backtracking from every position.
+    RE_VIM_END = re.compile(TermLogParser.RE_VIM_END_1.removeprefix(b".*") + b"|"
+                            + TermLogParser.RE_VIM_END_2.removeprefix(b".*"))
+
     def __init__(self, asciinfo, parser, document=None):
         super().__init__(document)
         self.asciinfo = asciinfo
         self.parser = parser
         self.byteline = bytearray()
         self.framebuffer = []
+        self.pending_frame = None
+        # The frame being parsed and its UTF-8 encoding, so that the encoding can be reused
+        self.frame = None
+        self.termline = b''
         self.capturing_vim = False
         self.vimrecording = VimRecording(asciinfo)
-        self.re_vim_end_1 = re.compile(TermLogParser.RE_VIM_END_1)
-        self.re_vim_end_2 = re.compile(TermLogParser.RE_VIM_END_2)
 
 
     def parse(self, line):
-        frame = json.loads(line)
+        frame = json_loads(line)
         termline = frame[2].encode('utf-8')
+        self.frame = frame
+        self.termline = termline
         self.document.frame_ts = frame[0]
 
         if self.in_vim:
@@ -297,26 +341,46 @@ class Asciinema2Html(VT2Html, VT500Parser.DefaultTerminalOutputHandler, VT500Par
         else:
             # Collect asciinema frames in a buffer until a newline appears
             # This is necessary to catch all frames leading up to a Vim session,
-            # since the start may be spread over multiple frames without a newline showing up
-            self.framebuffer.append(frame)
-
-        for c in termline:
-            self.byteline.append(c)
-            if c == 0x0A:
-                self.parser.parse(self.byteline)
-                self.byteline.clear()
-                self.framebuffer.clear()
+            # since the start may be spread over multiple frames without a newline showing up.
+            # Most frames contain a newline, so the frame is only added to the buffer when it is
+            # needed, i.e. a vim session starts in it or no newline follows in it.
+            self.pending_frame = frame
+
+        # Feed complete lines to the parser. Only a line that started in an earlier frame needs
+        # to be assembled in the line buffer, all others are handed over as slices of the frame.
+        byteline = self.byteline
+        framebuffer = self.framebuffer
+        parse_line = self.parser.parse
+        start = 0
+        eol = termline.find(b'\n')
+        while eol >= 0:
+            if byteline:
+                byteline += termline[start:eol + 1]
+                parse_line(byteline)
+                byteline.clear()
+            else:
+                parse_line(termline[start:eol + 1])
+            if framebuffer:
+                framebuffer.clear()
+            self.pending_frame = None
+            start = eol + 1
+            eol = termline.find(b'\n', start)
+        # Keep the remainder after the last newline until the line is completed
+        byteline += termline[start:]
+        if self.pending_frame is not None:
+            self.framebuffer.append(self.pending_frame)
+            self.pending_frame = None
 
 
     def vim_ends_in_frame(self, frame):
-        frameline = frame[2].encode('utf-8')
+        if frame is self.frame:
+            frameline = self.termline
+        else:
+            frameline = frame[2].encode('utf-8')
         return self.vim_ends_in_frame_line(frameline)
 
     def vim_ends_in_frame_line(self, frameline):
-        match = self.re_vim_end_1.search(frameline, re.MULTILINE)
-        if not match:
-            match = self.re_vim_end_2.search(frameline, re.MULTILINE)
-        return False if not match else True
+        return self.RE_VIM_END.search(frameline) is not None
 
 
     # Event handler methods
@@ -330,6 +394,9 @@ class Asciinema2Html(VT2Html, VT500Parser.DefaultTerminalOutputHandler, VT500Par
         else:
             height = -1
 
+        if self.pending_frame is not None:
+            self.framebuffer.append(self.pending_frame)
+            self.pending_frame = None
         self.vimrecording.start(self.framebuffer[0][0], height)
         # Check if the last frame includes the vim ending, since it also just triggered the session start
         if self.vim_ends_in_frame(self.framebuffer[-1]):
@@ -349,7 +416,7 @@ def parse(logfile, destfile=None, palette='MyDracula', title=None, chapters={},
     """Read the input file byte by byte and output as HTML, either to a file or to stdout."""
 
     line = logfile.readline()
-    asciinfo = json.loads(line)
+    asciinfo = json_loads(line)
     if not asciinfo.get('version') == 2:
         print("Asciinema file is not a version 2 recording. Cannot parse this file.")
         exit()
@@ -362,15 +429,12 @@ def parse(logfile, destfile=None, palette='MyDracula', title=None, chapters={},
     parser.control_sequence_handler = reader
     parser.tlp_event_listener = reader
 
-    line_no = 1
-    line = logfile.readline()
-    while line:
-        try:
-            reader.parse(line)
-            line = logfile.readline()
-            line_no += 1
-        except NotImplementedError:
-            raise NotImplementedError("Error in line %s: %s" % (line_no, line))
+    try:
+        parse_lines(logfile, reader.parse)
+    except Exception:
+        # Write out what was converted so far, which helps to locate the problem
+        html.flush_out()
+        raise
 
     html.finish()
 
@@ -382,19 +446,17 @@ def parse(logfile, destfile=None, palette='MyDracula', title=None, chapters={},
 
 def copy_asciinema_files(destdir):
     basedir = dirname(realpath(__file__))
-    acp_srcdir = basedir + "/acp/v" + str(ACP_VER)
+    acp_srcdir = join(basedir, "acp", f"v{ACP_VER}")
 
     # Copy over the asciinema files
-    acp_dstdir = destdir + "/" + ACP_DIR + "/v" + str(ACP_VER)
+    acp_dstdir = join(destdir, ACP_DIR, f"v{ACP_VER}")
     LOG.info("Copying player files from '%s' to '%s'", acp_srcdir, acp_dstdir)
-    if not exists(acp_dstdir):
-        makedirs(acp_dstdir)
+    makedirs(acp_dstdir, exist_ok=True)
+    shutil.copy(join(acp_srcdir, "asciinema-player.css"), acp_dstdir)
     if ACP_VER == 2:
-        shutil.copy(acp_srcdir + "/asciinema-player.css", acp_dstdir)
-        shutil.copy(acp_srcdir + "/asciinema-player.js", acp_dstdir)
+        shutil.copy(join(acp_srcdir, "asciinema-player.js"), acp_dstdir)
     else:
-        shutil.copy(acp_srcdir + "/asciinema-player.css", acp_dstdir)
-        shutil.copy(acp_srcdir + "/asciinema-player.min.js", acp_dstdir + "/asciinema-player.js")
+        shutil.copy(join(acp_srcdir, "asciinema-player.min.js"), join(acp_dstdir, "asciinema-player.js"))
 
 
 def main():
@@ -403,15 +465,15 @@ def main():
         exit()
 
     elif len(sys.argv) <= 2:
-        with open(sys.argv[1], mode="r", encoding="utf-8") as logfile:
+        with open(sys.argv[1], 'rb', buffering=INPUT_BUFFER_SIZE) as logfile:
             LOG.info("PlainOut:: Parsing file %s", sys.argv[1])
             parse(logfile)
 
     else:
         if not exists(dirname(sys.argv[2])):
             makedirs(dirname(sys.argv[2]))
-        with open(sys.argv[2], mode='w', encoding="utf-8") as destfile:
-            with open(sys.argv[1], mode="r", encoding="utf-8") as logfile:
+        with open(sys.argv[2], mode='w', encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as destfile:
+            with open(sys.argv[1], 'rb', buffering=INPUT_BUFFER_SIZE) as logfile:
                 LOG.info("PlainOut:: Parsing file %s to %s", sys.argv[1], sys.argv[2])
                 html = parse(logfile, destfile)
 
@@ -0,0 +1,6 @@
+# JSON input is decoded with orjson when it is available. It is a lot faster on the many small JSON lines
+# of a recording. The standard library json module is used otherwise.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
@@ -1,12 +1,12 @@
 import logging
 import argparse
-import json
-from os.path import dirname, isabs, splitext, exists, join
+from os.path import dirname, isabs, splitext, join
 from os import makedirs
 import sys
-from terminal2html import parse as html_parse, HopTarget
+from terminal2html import parse as html_parse, HopTarget, OUTPUT_BUFFER_SIZE, INPUT_BUFFER_SIZE
 from asciinema2html import parse as asciinema_parse, copy_asciinema_files
 from twebber import parse as parse_hops
+from jsonloader import json_loads
 
 # Press Shift+F10 to execute it or replace it with your code.
 # Press Double Shift to search everywhere for classes, files, tool windows, actions, and settings.
@@ -15,6 +15,8 @@ LOG = logging.getLogger()
 
 
 class TodoArgs:
+    __slots__ = ('infile', 'format', 'outfile', 'palette', 'review_mode', 'title', 'chapters', 'filter', 'hopto')
+
     def __init__(self, args):
         self.infile = args.infile
         self.format = 'terminal'
@@ -99,7 +101,7 @@ class Index:
             return
 
         if not title:
-            title = splitext(outfile)
+            title = splitext(outfile)[0]
 
         self.files[outfile] = {'title' : title}
 
@@ -109,23 +111,23 @@ class Index:
 
         self.files[outfile]['chapters'] = chapters
 
-    def build_body(self):
-        body_string = self.html_body_string
-        for filename in self.files:
-            file = self.files[filename]
-            body_string += '\n  <h2><a href="' + filename + '">' + file['title'] + '</a></h2>\n'
+    def body_fragments(self):
+        """ Generate the HTML fragments of the page body, one per file heading and chapter link. """
+        yield self.html_body_string
+        for filename, file in self.files.items():
+            yield f'\n  <h2><a href="{filename}">{file["title"]}</a></h2>\n'
 
             if 'chapters' in file:
                 chapters = file['chapters']
                 for id in chapters:
                     if id:
-                        body_string += '    <section><a href="' + filename + '#c' + id + '">' + chapters[id] + '</a></section>\n'
-        return body_string
-
+                        yield f'    <section><a href="{filename}#c{id}">{chapters[id]}</a></section>\n'
 
-    def get_html_page(self):
-
-        return self.html_intro + self.build_body() + self.html_outro
+    def write_to(self, fh):
+        """ Write the page to a file, without assembling it in memory first. """
+        fh.write(self.html_intro)
+        fh.writelines(self.body_fragments())
+        fh.write(self.html_outro)
 
 
 
@@ -138,13 +140,18 @@ def parse_to_html(args, logfile, destfile):
     else:
         html_parse(logfile, destfile, palette=args.palette, title=args.title, chapters=args.chapters, cmd_filter=args.filter, hopto=args.hopto, review=args.review_mode)
 
-def parse_file(args):
-    with open(args.infile, 'rb') as logfile:
+def parse_file(args, created_dirs=None):
+    """ Convert the input file. Output directories already in the created_dirs set are not checked again. """
+    with open(args.infile, 'rb', buffering=INPUT_BUFFER_SIZE) as logfile:
         LOG.info("Parsing file %s", args.infile)
         if args.outfile:
-            if not exists(dirname(args.outfile)):
-                makedirs(dirname(args.outfile))
-            with open(args.outfile, encoding="utf-8", mode='w') as destfile:
+            out_dir = dirname(args.outfile)
+            if created_dirs is None or out_dir not in created_dirs:
+                if out_dir:
+                    makedirs(out_dir, exist_ok=True)
+                if created_dirs is not None:
+                    created_dirs.add(out_dir)
+            with open(args.outfile, encoding="utf-8", mode='w', buffering=OUTPUT_BUFFER_SIZE) as destfile:
                 parse_to_html(args, logfile, destfile)
         else:
             parse_to_html(args, logfile, None)
@@ -158,21 +165,9 @@ def parse_file_hops(fromfile, tofile):
 #     """ Redefined join since even under windows we work in a Linux shell """
 #     return path + '/' + file
 
-def files_by_id(file_list, dir=''):
-    filedict = {}
-    for file in file_list:
-        if 'id' in file and file['id']:
-            if dir:
-                filedict[file['id']] = file[dir]
-            else:
-                filedict[file['id']] = (file['in'], file['out'])
-
-    return filedict
-
-
 def process_file_list(args, file_list_file):
-    with open(file_list_file, 'r', encoding="utf-8") as file_list:
-        data = json.load(file_list)
+    with open(file_list_file, 'rb') as file_list:
+        data = json_loads(file_list.read())
 
         base_dir_in = dirname(file_list_file)
         if 'base_dir_in' in data and data['base_dir_in']:
@@ -197,9 +192,17 @@ def process_file_list(args, file_list_file):
             index_title = "Git Training"
 
         index = Index(index_title)
+        created_dirs = set()
+
+        # Per file options are top level entries keyed by '<id>-chapters', '<id>-suppress' and '<id>-hopto'.
+        # Collect them by file id in one pass.
+        chapters_by_id = {key.removesuffix('-chapters'): value for key, value in data.items() if key.endswith('-chapters')}
+        suppress_by_id = {key.removesuffix('-suppress'): value for key, value in data.items() if key.endswith('-suppress')}
+        hopto_by_id = {key.removesuffix('-hopto'): value for key, value in data.items() if key.endswith('-hopto')}
 
         if data['files']:
-            files = files_by_id(data['files'])
+            # Input and output file names by file id, to resolve references between files
+            files = {file['id']: (file['in'], file['out']) for file in data['files'] if file.get('id')}
             for file in data['files']:
                 in_file = join(base_dir_in, file['in'])
                 if 'out' in file and file['out']:
@@ -212,7 +215,7 @@ def process_file_list(args, file_list_file):
                 if 'format' in file and file['format']:
                     log_format = file['format']
                     if log_format != 'terminal' and log_format != 'asciinema':
-                        print("Unsupported input file format '%s' for file '%s'. Exiting.".format(log_format, file['in']), file=sys.stderr)
+                        print(f"Unsupported input file format '{log_format}' for file '{file['in']}'. Exiting.", file=sys.stderr)
                         return
                 else:
                     log_format = 'terminal'
@@ -235,24 +238,18 @@ def process_file_list(args, file_list_file):
                     my_args.review_mode = file['review']
 
                 if 'id' in file and file['id']:
-                    chapters = file['id'] + '-chapters'
-                    if chapters in data:
-                        index.add_chapters(out_file_name, data[chapters])
-                        my_args.chapters = data[chapters]
-
-                    filter = file['id'] + '-suppress'
-                    if filter in data:
-                        my_args.filter = data[filter]
-
-                    hopto = file['id'] + '-hopto'
-                    if hopto in data:
-                        my_args.hopto = data[hopto]
-                        ofid = data[hopto]['id']
-                        tfilterid = ofid + '-suppress'
-                        if tfilterid in data:
-                            tfilter = data[tfilterid]
-                        else:
-                            tfilter = tuple()
+                    file_id = file['id']
+                    if file_id in chapters_by_id:
+                        index.add_chapters(out_file_name, chapters_by_id[file_id])
+                        my_args.chapters = chapters_by_id[file_id]
+
+                    if file_id in suppress_by_id:
+                        my_args.filter = suppress_by_id[file_id]
+
+                    if file_id in hopto_by_id:
+                        my_args.hopto = hopto_by_id[file_id]
+                        ofid = my_args.hopto['id']
+                        tfilter = suppress_by_id.get(ofid, tuple())
                         my_args.hopto['target'] = HopTarget(ofid, files[ofid][1], tfilter)
                         print(len(tfilter))
 
@@ -264,14 +261,14 @@ def process_file_list(args, file_list_file):
                         my_args.hopto['rev_hops'] = ahops.hops_from_left
 
 
-                print("Process")
-                print(f"    {my_args.infile}")
-                print(f" -> {my_args.outfile}")
-                print(f" as {my_args.title}")
-                print(f" in {my_args.palette}")
+                sys.stdout.write(f"Process\n"
+                                 f"    {my_args.infile}\n"
+                                 f" -> {my_args.outfile}\n"
+                                 f" as {my_args.title}\n"
+                                 f" in {my_args.palette}\n")
                 sys.stdout.flush()
 
-                parse_file(my_args)
+                parse_file(my_args, created_dirs)
 
 
     print("Generating index file")
@@ -280,10 +277,9 @@ def process_file_list(args, file_list_file):
 
 def generate_index(base_dir_out, index : Index):
     index_file = join(base_dir_out, "index.html")
-    if not exists(dirname(index_file)):
-        makedirs(dirname(index_file))
+    makedirs(dirname(index_file), exist_ok=True)
     with open(index_file, encoding="utf-8", mode='w') as indexfile:
-        indexfile.write(index.get_html_page())
+        index.write_to(indexfile)
 
 
 def main():
@@ -1,7 +1,8 @@
+import functools
 import logging
-import re
 import html
 import sys
+from bisect import bisect_right
 from os.path import dirname, exists
 from os import makedirs
 
@@ -12,6 +13,12 @@ from vtparser import VT500Parser
 
 LOG = logging.getLogger()
 
+# Buffer size for HTML output files. The document is written in many small pieces,
+# so a large buffer saves a lot of write calls to the operating system.
+OUTPUT_BUFFER_SIZE = 128 * 1024
+# Buffer size for log input files. They are read line by line, mostly in short lines.
+INPUT_BUFFER_SIZE = 1024 * 1024
+
 
 class HopTarget:
     """
@@ -24,6 +31,8 @@ class HopTarget:
         self.id = id
         self.name = name
         self.filter = filter
+        # Sorted, so that the number of filtered commands up to a hop can be found by bisection
+        self.sorted_filter = sorted(filter)
 
     def get_target(self, hop):
         """ Get the anchor in the target """
@@ -31,26 +40,28 @@ class HopTarget:
 
     def get_target_cmd(self, hop):
         """ Get the translated command number to show, when filtering out commands before it """
-        cmdnum = hop
-        for cmd in self.filter:
-            if hop < cmd: break
-            cmdnum -= 1
-        return str(cmdnum)
+        return str(hop - bisect_right(self.sorted_filter, hop))
 
 
 class HtmlDocumentCreator:
     """
-    Take characters to print in `write` function and formatting
+    Take characters to print in `write_run` function and formatting
     information in `write_csi` function and write a formatted
     HTML file from it.
     """
 
+    # Number of collected output pieces after which the buffer is written out at the next line end,
+    # so that a long command output is not held in memory until its command block ends.
+    OUT_BUF_MAX = 64 * 1024
+
     HTML_MAP = {
         '&': '&amp;',
         '>': '&gt;',
         '<': '&lt;',
         '"': '&quot;',
     }
+    # Translation table to escape a whole run of characters at once
+    HTML_TRANS = str.maketrans(HTML_MAP)
 
     SCHEMES = {
         'Dracula': {
@@ -199,27 +210,24 @@ class HtmlDocumentCreator:
 
     def __init__(self, out_fh=sys.stdout, palette="MyDracula", dark_bg=True, title=None, chapters={}, cmd_filter=[], hopto=None, review=False):
         self.fh = out_fh if out_fh is not None else sys.stdout
+        # Output is collected in a list and written to the file once per command block,
+        # instead of handing every single character to the file object.
+        self.out_buf = []
+        self.out = self.out_buf.append
         self.palette = palette if palette is not None else 'MyDracula'
         self.dark_bg = dark_bg
         self.bold_as_bright = True
         self.title = title
         self.chapters = chapters
-        self.filter = cmd_filter
+        self.filter = frozenset(cmd_filter) if cmd_filter else frozenset()
         self.hopto = hopto if hopto else {'hops':[-1]}
         self.curr_hop = 0
         self.review_mode = review
         if not 'hops' in self.hopto:
             self.hopto['hops'] = [-1]
 
-        sdict = self.SCHEMES[self.palette].copy()
-        sdict['fw'] = self.SCHEMES['BoldAsBright'][self.bold_as_bright]['fw']
-        sdict['cf9'] = self.SCHEMES[self.palette][self.SCHEMES['DarkBg'][self.dark_bg]['F9']]
-        sdict['cb9'] = self.SCHEMES[self.palette][self.SCHEMES['DarkBg'][self.dark_bg]['B9']]
-        bf9 = self.SCHEMES['DarkBg'][self.dark_bg]['bF9'] if self.bold_as_bright else self.SCHEMES['DarkBg'][self.dark_bg]['F9']
-        sdict['bf9'] = self.SCHEMES[self.palette][bf9]
-        sdict['title'] = self.title
-
-        self.html_intro = (self.HTML_INTRO + ''.join(self.gather_head_elems()) + self.BODY_INTRO) % sdict
+        self.html_intro = self.intro_template(''.join(self.gather_head_elems()), self.palette, self.dark_bg,
+                                              self.bold_as_bright).replace(self.TITLE_PLACEHOLDER, str(self.title))
         self.html_body_string = ""
         self.html_outro = self.HTML_OUTRO
         self.html_span_stack = []
@@ -227,7 +235,33 @@ class HtmlDocumentCreator:
         self.cmd_number = 0
 
         self.output_suppressed = False
-        self.fh.write(self.html_intro)
+        self.out(self.html_intro)
+
+
+    def flush_out(self):
+        """ Write the collected output to the file. """
+        if self.out_buf:
+            self.fh.write(''.join(self.out_buf))
+            self.out_buf.clear()
+
+
+    # Stands in for the title in the cached intro template
+    TITLE_PLACEHOLDER = '\x00title\x00'
+
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def intro_template(cls, head_elems, palette, dark_bg, bold_as_bright):
+        """ Fill in the color scheme of the HTML intro. The title is left as a placeholder, so that the
+        intro is only built once for all documents converted with the same settings. """
+        sdict = cls.SCHEMES[palette].copy()
+        sdict['fw'] = cls.SCHEMES['BoldAsBright'][bold_as_bright]['fw']
+        sdict['cf9'] = cls.SCHEMES[palette][cls.SCHEMES['DarkBg'][dark_bg]['F9']]
+        sdict['cb9'] = cls.SCHEMES[palette][cls.SCHEMES['DarkBg'][dark_bg]['B9']]
+        bf9 = cls.SCHEMES['DarkBg'][dark_bg]['bF9'] if bold_as_bright else cls.SCHEMES['DarkBg'][dark_bg]['F9']
+        sdict['bf9'] = cls.SCHEMES[palette][bf9]
+        sdict['title'] = cls.TITLE_PLACEHOLDER
+
+        return (cls.HTML_INTRO + head_elems + cls.BODY_INTRO) % sdict
 
 
     def gather_head_elems(self):
@@ -237,34 +271,52 @@ class HtmlDocumentCreator:
         return elems
 
 
-    def write(self, char):
+    def write_run(self, text):
+        """ Write a run of characters, escaped in one go. """
         if self.output_suppressed:
             return
 
-        if char in self.HTML_MAP:
-            self.fh.write(self.HTML_MAP[char])
-        else:
-            self.fh.write(char)
-
-    RE_FG_SPAN = re.compile("(color:rgb)|(e?f)")
-    RE_BG_SPAN = re.compile("(background-color:rgb)|(e?b[0-9])")
-    RE_BOLD_SPAN = re.compile("bold")
-    RE_UNDERLINE_SPAN = re.compile("underline")
-    RE_REVERSE_SPAN = re.compile("reverse")
+        self.out(text.translate(self.HTML_TRANS))
+        if len(self.out_buf) >= self.OUT_BUF_MAX and '\n' in text:
+            self.flush_out()
+
+    # Categories of the spans on the span stack, so that a closing SGR directive finds its span
+    SPAN_FG = 'fg'
+    SPAN_BG = 'bg'
+    SPAN_BOLD = 'bold'
+    SPAN_UNDERLINE = 'underline'
+    SPAN_BLINK = 'blink'
+    SPAN_REVERSE = 'reverse'
+
+    # The (class, category) of the span opened by an SGR color or attribute parameter, and the category
+    # of the span closed by an SGR parameter
+    SGR_COLOR_CLASSES = {base + i: (f'{prefix}{offset + i}', category)
+                         for base, prefix, offset, category in ((30, 'f', 0, SPAN_FG), (40, 'b', 0, SPAN_BG),
+                                                                (90, 'ef', 8, SPAN_FG), (100, 'eb', 8, SPAN_BG))
+                         for i in range(8)}
+    SGR_ATTRIBUTE_CLASSES = {1: ('bold', SPAN_BOLD), 4: ('underline', SPAN_UNDERLINE),
+                             5: ('blink', SPAN_BLINK), 7: ('reverse', SPAN_REVERSE)}
+    SGR_CLOSE_SPANS = {22: SPAN_BOLD, 24: SPAN_UNDERLINE, 27: SPAN_REVERSE, 39: SPAN_FG, 49: SPAN_BG}
+
+    # Opening tags of the class spans, made once instead of for every SGR sequence
+    CLASS_SPANS = {cls: f'<span class="{cls}">'
+                   for cls in [f'{prefix}{n}' for prefix in ('f', 'b') for n in range(8)] +
+                              [f'{prefix}{n}' for prefix in ('ef', 'eb') for n in range(256)] +
+                              ['bold', 'underline', 'blink', 'reverse']}
 
     def convert_csi(self, _private, param, _intermediate, final):
         if self.output_suppressed:
             return
 
         if final == 'm':
-            span = ''
+            spans = []
             if param == '' or param == '0' or param == '00':
                 # close all spans
-                span = "</span>" * len(self.html_span_stack)
+                spans.append("</span>" * len(self.html_span_stack))
                 self.html_span_stack = []
             else:
                 s_classes = []
-                s_style = ''
+                s_style = None
                 params = param.split(';')
 
                 if params[0] == '38' or params[0] == '48':
@@ -277,116 +329,99 @@ class HtmlDocumentCreator:
                         indicator = params[1]
                         if indicator == '5':  # Indexed Color
                             if params[0] == '38':
-                                s_classes.append('ef' + params[2])
+                                s_classes.append(('ef' + params[2], self.SPAN_FG))
                             else:
-                                s_classes.append('eb' + params[2])
+                                s_classes.append(('eb' + params[2], self.SPAN_BG))
                         else:  # RGB color
                             if params[0] == '38':
-                                s_style = 'color:rgb(' + params[-3] + ',' + params[-2] + ',' + params[-1] + ')'
+                                s_style = ('color:rgb(' + params[-3] + ',' + params[-2] + ',' + params[-1] + ')',
+                                           self.SPAN_FG)
                             else:
-                                s_style = 'background-color:rgb(' + params[-3] + ',' + params[-2] + ',' + params[-1] + ')'
+                                s_style = ('background-color:rgb(' + params[-3] + ',' + params[-2] + ',' + params[-1] + ')',
+                                           self.SPAN_BG)
                 else:
                     for p in params:
-                        if 30 <= int(p) <= 37:
-                            s_classes.insert(0, "f" + p[-1])
-                        elif 40 <= int(p) <= 47:
-                            s_classes.insert(0, "b" + p[-1])
-                        elif 90 <= int(p) <= 97:
-                            s_classes.insert(0, "ef" + str(8 + int(p[-1])))
-                        elif 100 <= int(p) <= 107:
-                            s_classes.insert(0, "eb" + str(8 + int(p[-1])))
-                        elif int(p) == 1:
-                            s_classes.append('bold')
-                        elif int(p) == 4:
-                            s_classes.append('underline')
-                        elif int(p) == 5:
-                            s_classes.append('blink')
-                        elif int(p) == 7:
-                            s_classes.append('reverse')
-                        elif p == '22':
-                            # Close a bold directive.
-                            span += self._close_span(self.RE_BOLD_SPAN, p)
-                        elif p == '24':
-                            # Close an underline directive.
-                            span += self._close_span(self.RE_UNDERLINE_SPAN, p)
-                        elif p == '27':
-                            # Close an reverse directive.
-                            span += self._close_span(self.RE_REVERSE_SPAN, p)
-                        elif p == '39':
-                            # Close a fg color directive.
-                            span += self._close_span(self.RE_FG_SPAN, p)
-                        elif p == '49':
-                            # Close a bg color directive.
-                            span += self._close_span(self.RE_BG_SPAN, p)
+                        code = int(p)
+                        if code in self.SGR_COLOR_CLASSES:
+                            s_classes.insert(0, self.SGR_COLOR_CLASSES[code])
+                        elif code in self.SGR_ATTRIBUTE_CLASSES:
+                            s_classes.append(self.SGR_ATTRIBUTE_CLASSES[code])
+                        elif code in self.SGR_CLOSE_SPANS:
+                            # Close a bold, underline, reverse, fg color or bg color directive.
+                            self._close_span(self.SGR_CLOSE_SPANS[code], p, spans)
                         else:
                             raise NotImplementedError("Implementation missing for CSI " + p + " m")
-                for cls in s_classes:
-                    span += '<span class="' + cls + '">'
-                    self.html_span_stack.append((cls, 'class'))
+                for cls, category in s_classes:
+                    spans.append(self.CLASS_SPANS.get(cls) or '<span class="' + cls + '">')
+                    self.html_span_stack.append((cls, 'class', category))
                 if s_style:
-                    span = '<span style="' + s_style + '">'
-                    self.html_span_stack.append((s_style, 'style'))
-            if span:
-                self.fh.write(span)
+                    spans.append('<span style="' + s_style[0] + '">')
+                    self.html_span_stack.append((s_style[0], 'style', s_style[1]))
+            if spans:
+                self.out(''.join(spans))
 
-    def _close_span(self, regex, directive):
+    def _close_span(self, category, directive, spans):
         # Close a directive span. This is easy if it is the last on the stack. Otherwise,
         # we have to close and open again the other directives after it.
-        spans = ''
+        # The html elements are appended to the spans list.
         idx = len(self.html_span_stack) - 1
         for span in reversed(self.html_span_stack):
-            if regex.match(span[0]):
+            if span[2] == category:
                 break
             idx -= 1
         if idx < 0:
             raise IndexError("Could not find any matching span for directive " + directive + "m")
 
         # Close the span elements behind and including the one we want to get rid of
-        for i in range(idx, len(self.html_span_stack)):
-            spans += "</span>"
+        spans.append("</span>" * (len(self.html_span_stack) - idx))
 
         # Delete the one we want to keep closed
         del self.html_span_stack[idx]
 
         # Open the span elements again, that we closed but want to keep
-        for i in range(idx, len(self.html_span_stack)):
-            spans += '<span ' + self.html_span_stack[i][1] + '="' + self.html_span_stack[i][0] + '">'
-
-        return spans
+        for payload, kind, _category in self.html_span_stack[idx:]:
+            spans.append('<span ' + kind + '="' + payload + '">')
 
     def close_all_spans(self):
         if self.html_span_stack:
-            self.fh.write("</span>" * len(self.html_span_stack))
+            self.out("</span>" * len(self.html_span_stack))
             self.html_span_stack = []
 
     def start_cmd_block(self):
         """ Begin a new command block: prompt, command and command output, or continuation of a previous block."""
-        self.fh.write('      <pre class="cmd">')
+        self.out('      <pre class="cmd">')
 
     def end_cmd_block(self):
         """ End a new block, closing all open spans."""
         self.close_all_spans()
-        self.fh.write("\n      </pre>\n")
+        self.out("\n      </pre>\n")
+        self.flush_out()
 
     def end_cmd_row(self):
         """ End current command row """
         self.end_cmd_block()
-        self.fh.write("    </div>\n  </div>\n\n")
+        self.out("    </div>\n  </div>\n\n")
 
     def add_hopto_link(self):
-        if self.hopto['hops'][self.curr_hop] == self.cmd_count:
-            target_cmd = str(self.hopto['hops'][self.curr_hop+1])
-            target = self.hopto['target'].get_target(target_cmd)
-            target_cmd =  self.hopto['target'].get_target_cmd(int(target_cmd))
-            self.fh.write('\n  <div class="cmd-hop">\n')
-            self.fh.write('    <a class="cmd-hop" href="{}">{} jump to {} command {} {}</a>\n'
-                          .format(target, html.escape(self.hopto['pre']),  html.escape(self.hopto['to']),  target_cmd, html.escape(self.hopto['post'])))
-            self.fh.write('  </div>\n\n')
-            if self.curr_hop +2 < len(self.hopto['hops']) -1:
+        hopto = self.hopto
+        hops = hopto['hops']
+        if hops[self.curr_hop] == self.cmd_count:
+            target_cmd = str(hops[self.curr_hop+1])
+            target = hopto['target'].get_target(target_cmd)
+            target_cmd =  hopto['target'].get_target_cmd(int(target_cmd))
+            self.out('\n  <div class="cmd-hop">\n')
+            self.out('    <a class="cmd-hop" href="{}">{} jump to {} command {} {}</a>\n'
+                     .format(target, html.escape(hopto['pre']),  html.escape(hopto['to']),  target_cmd, html.escape(hopto['post'])))
+            self.out('  </div>\n\n')
+            if self.curr_hop +2 < len(hops) -1:
                 self.curr_hop += 2
             else:
                 self.curr_hop = -1
 
+    CHAPTER_HEADING = '  <h3%s>%s</h3>\n\n'
+    CMD_ROW_START = ('  <div class="cmd-row"%s>\n    <div class="cmd-num"><span class="cmd-count%s">%d</span><br/>'
+                     '%d</div>\n    <div class="cmd-wrapper">\n')
+
     def start_new_cmd_row(self):
         self.cmd_count += 1
         if self.cmd_count in self.filter:
@@ -395,15 +430,16 @@ class HtmlDocumentCreator:
             return
 
         self.output_suppressed = False
+        self.cmd_number += 1
+        anchor_id = ' id="c%d"' % self.cmd_count
+        review = " cmd-count-review" if self.review_mode else ""
         idx = str(self.cmd_count)
-        anchor_id = f' id="c{self.cmd_count}"'
         if idx in self.chapters:
-            self.fh.write('  <h3{}>{}</h3>\n\n'.format(anchor_id, self.chapters[idx]))
-            anchor_id = ''
-        self.cmd_number += 1
-        self.fh.write('  <div class="cmd-row"{}>\n    <div class="cmd-num"><span class="cmd-count{review}">{count}</span><br/>'
-                      '{num}</div>\n    <div class="cmd-wrapper">\n'
-                      .format(anchor_id, count=self.cmd_count, num=self.cmd_number, review=" cmd-count-review" if self.review_mode else ""))
+            # The anchor goes to the chapter heading instead of the command row
+            self.out(self.CHAPTER_HEADING % (anchor_id, self.chapters[idx]) +
+                     self.CMD_ROW_START % ('', review, self.cmd_count, self.cmd_number))
+        else:
+            self.out(self.CMD_ROW_START % (anchor_id, review, self.cmd_count, self.cmd_number))
         self.start_cmd_block()
 
 
@@ -411,7 +447,7 @@ class HtmlDocumentCreator:
         """ Begin a new command row, with command number and command, maybe a hop target link.  """
         self.end_cmd_row()
 
-        self.add_hop_to_link()
+        self.add_hopto_link()
 
         self.start_new_cmd_row()
 
@@ -419,11 +455,12 @@ class HtmlDocumentCreator:
     def vim_session(self):
         if self.output_suppressed:
             return
-        self.fh.write('      <span class="vim-session">[==-- Vim editor session --==]</span>\n')
+        self.out('      <span class="vim-session">[==-- Vim editor session --==]</span>\n')
 
     def finish(self):
         """ Finish output. Writing it out or closing a file or something. """
-        self.fh.write(self.html_outro)
+        self.out(self.html_outro)
+        self.flush_out()
         if self.fh is not sys.stdout:
             self.fh.close()
 
@@ -435,6 +472,8 @@ class LineBuilder:
     def __init__(self):
         self.line = []
         self.pos = 0
+        # Set when a CSI tuple is put on the line. Lines without one are handled as plain characters.
+        self.has_csi = False
         self.prefix_start = 0   # Length of characters on line in prefixing line builder, which this one doesn't see.
                                 # Expressed as negative index, indicating the start of the prefix: -2, -1, 0, 1, 2, ...
 
@@ -442,7 +481,7 @@ class LineBuilder:
         """ Add a normal character """
         if self.pos >= 0:    # Is not in prefix
             if self.pos >= len(self.line):
-                self.line.insert(self.pos, code)
+                self.line.append(code)
             else:
                 self.line[self.pos] = code
         self.pos += 1
@@ -459,7 +498,7 @@ class LineBuilder:
             # This should terminate the command line. Add it so it gets printed.
             if self.prefix_start < self.pos < 0:
                 raise IndexError(f"Newline (LF) occurred while in line prefix (@{self.pos})")
-            self.line.insert(len(self.line), code)
+            self.line.append(code)
             self.pos += 1
 
     # Everything else is discarded, as we do not need it to build the command line
@@ -480,7 +519,7 @@ class LineBuilder:
         elif final == 'C':  # Cursor forward
             times = 1 if param == '' else int(param)
             while times > 0:
-                while self.pos >= 0 and self.pos < len(self.line) and isinstance(self.line[self.pos], tuple):
+                while self.has_csi and 0 <= self.pos < len(self.line) and isinstance(self.line[self.pos], tuple):
                     self.pos += 1  # Skip over CSI
                 if self.pos >= len(self.line):  # Add spaces to the end of our line
                     self.line.append(ord(' '))
@@ -527,8 +566,9 @@ class LineBuilder:
             LOG.info("Discard unused control sequence CSI %s%s %s %s", private, param, interm, final)
 
     def _insert_csi(self, private, param, interm, final):
+        self.has_csi = True
         if self.pos >= len(self.line):
-            self.line.insert(self.pos, ('CSI', [private, param, interm, final]))
+            self.line.append(('CSI', [private, param, interm, final]))
         else:
             self.line[self.pos] = ('CSI', [private, param, interm, final])
         self.pos += 1
@@ -537,6 +577,7 @@ class LineBuilder:
         """ Clear line """
         self.line = []
         self.pos = 0
+        self.has_csi = False
         self.prefix_start = 0
 
     def set_prefix_len(self, ptls):
@@ -547,6 +588,8 @@ class LineBuilder:
 
     def printable_size(self):
         """ Get the number of printable characters on the line, which excludes CSI tuples """
+        if not self.has_csi:
+            return len(self.line)
         size = 0
         for elem in self.line:
             if not isinstance(elem, tuple):
@@ -575,16 +618,25 @@ class VT2Html(VT500Parser.DefaultTerminalOutputHandler, VT500Parser.DefaultContr
 
     def print_cmd_line(self):
         # Start with the prompt and pause
-        for code in self.command_line.line:
-            self.document.write(chr(code))
+        self.document.write_run(''.join(map(chr, self.command_line.line)))
 
     def print_term_line(self, line):
-        for elem in line.line:
+        elems = line.line
+        if not line.has_csi:
+            self.document.write_run(''.join(map(chr, elems)))
+            return
+
+        # Write the characters between the CSI tuples as runs
+        start = 0
+        for i, elem in enumerate(elems):
             if isinstance(elem, tuple):
+                if start < i:
+                    self.document.write_run(''.join(map(chr, elems[start:i])))
+                start = i + 1
                 if elem[0] == 'CSI':
                     self.document.convert_csi(elem[1][0], elem[1][1], elem[1][2], elem[1][3])
-            else:
-                self.document.write(chr(elem))
+        if start < len(elems):
+            self.document.write_run(''.join(map(chr, elems[start:])))
 
     # Output handler methods
     def print(self, code):
@@ -682,6 +734,15 @@ class VT2Html(VT500Parser.DefaultTerminalOutputHandler, VT500Parser.DefaultContr
         self.document.vim_session()
 
 
+def parse_lines(logfile, parse_line):
+    """Feed the input file line by line to the parse_line function. Errors are reported with the line number."""
+    for line_no, line in enumerate(logfile, 1):
+        try:
+            parse_line(line)
+        except NotImplementedError:
+            raise NotImplementedError("Error in line %s: %s" % (line_no, line))
+
+
 def parse(logfile, destfile=None, palette='MyDracula', title=None, chapters={}, cmd_filter=[], hopto=None, review=False):
     """Read the input file byte by byte and output as HTML, either to a file or to stdout."""
     html = HtmlDocumentCreator(destfile, palette=palette, title=title, chapters=chapters, cmd_filter=cmd_filter, hopto=hopto, review=review)
@@ -691,15 +752,12 @@ def parse(logfile, destfile=None, palette='MyDracula', title=None, chapters={},
     parser.control_sequence_handler = output_processor
     parser.tlp_event_listener = output_processor
 
-    line_no = 1
-    line = logfile.readline()
-    while line:
-        try:
-            parser.parse(line)
-            line = logfile.readline()
-            line_no += 1
-        except NotImplementedError:
-            raise NotImplementedError("Error in line %s: %s" % (line_no, line))
+    try:
+        parse_lines(logfile, parser.parse)
+    except Exception:
+        # Write out what was converted so far, which helps to locate the problem
+        html.flush_out()
+        raise
 
     html.finish()
 
@@ -713,15 +771,15 @@ def main():
         exit()
 
     elif len(sys.argv) <= 2:
-        with open(sys.argv[1], 'rb') as logfile:
+        with open(sys.argv[1], 'rb', buffering=INPUT_BUFFER_SIZE) as logfile:
             LOG.info("PlainOut:: Parsing file %s", sys.argv[1])
             parse(logfile)
 
     else:
         if not exists(dirname(sys.argv[2])):
             makedirs(dirname(sys.argv[2]))
-        with open(sys.argv[2], encoding="utf-8", mode='w') as destfile:
-            with open(sys.argv[1], 'rb') as logfile:
+        with open(sys.argv[2], encoding="utf-8", mode='w', buffering=OUTPUT_BUFFER_SIZE) as destfile:
+            with open(sys.argv[1], 'rb', buffering=INPUT_BUFFER_SIZE) as logfile:
                 LOG.info("PlainOut:: Parsing file %s to %s", sys.argv[1], sys.argv[2])
                 parse(logfile, destfile)
 
@@ -179,7 +179,7 @@ class TermLogParser(VT500Parser):
                         file = " with file {}".format(match2.group('file'))
 
             if match0 or match1 or match2:
-                LOG.info("=====>   vim is starting {}{}  <=======".format(file, height))
+                LOG.info("=====>   vim is starting %s%s  <=======", file, height)
                 # The vim session might be on only one single line, i.e. no 0x0A in the session
                 self.emit(self.STATE_VIM_START, props)
                 match1 = self.re_vim_end_1.match(line[-70:])
@@ -200,7 +200,9 @@ class TermLogParser(VT500Parser):
 
         # Finally, feed the line character by character to the VT parser
         self.line_pos = 0
-        for c in line:
+        end = len(line)
+        while self.line_pos < end:
+            c = line[self.line_pos]
             #  An OSC string will try to set the window title. This is the marker that we have a prompt coming up.
             #  Check if the prompt follows directly after in this line
             if self.tlp_state == self.STATE_PROMPT_OSC:
@@ -241,7 +243,7 @@ class TermLogParser(VT500Parser):
                                 props['file'] = match2.group('file')
                                 file = " with file {}".format(match2.group('file'))
 
-                LOG.info("=====>   vim is starting again{}{}  <=======".format(file, height))
+                LOG.info("=====>   vim is starting again%s%s  <=======", file, height)
                 # The vim session might be on only one single line, i.e. no 0x0A in the session
                 self.emit(self.STATE_VIM_START, props)
                 match1 = self.re_vim_end_1.match(line[-70:])
@@ -260,6 +262,12 @@ class TermLogParser(VT500Parser):
             self.input(c)
             self.line_pos += 1
 
+            # A following run of printable characters can be handed to the VT parser at once, as long as no
+            # position in it needs checking: not while looking for the prompt, and not past an upcoming vim start.
+            if self.tlp_state != self.STATE_PROMPT_OSC and self.tlp_state != self.STATE_PROMPT_IMMINENT:
+                run_end = self.next_vim if self.next_vim >= self.line_pos else end
+                self.line_pos = self.print_run(line, self.line_pos, run_end)
+
     def emit(self, tlp_state, props=None):
         """ Emit an event that we have found some pattern in the parsed log """
         if tlp_state == self.STATE_PROMPT_OSC:
@@ -393,10 +401,8 @@ class TermLogParser(VT500Parser):
 def parse(logfile):
     """Read the input file line by line """
     parser = TermLogParser()
-    line = logfile.readline()
-    while line:
+    for line in logfile:
         parser.parse(line)
-        line = logfile.readline()
 
     # Gather statistics and dump to log
     parser.log_statistics()
@@ -26,6 +26,10 @@ class VT2Output(VT500Parser.DefaultTerminalOutputHandler, VT500Parser.DefaultCon
         self.in_prompt = False
         self.in_vim = False
 
+        # Output is collected and written to stdout line by line. It is flushed whenever output is paced.
+        self.out_buf = []
+        self.out = self.out_buf.append
+
 
     def print(self, code):
         """The current code should be mapped to a glyph according to the character set mappings and shift states
@@ -36,18 +40,18 @@ class VT2Output(VT500Parser.DefaultTerminalOutputHandler, VT500Parser.DefaultCon
                 self.build_cmd_line_print(code)
             else:
                 sleep(0.2 * (1.0/self.speed))
-                sys.stdout.write(chr(code))
-                sys.stdout.flush()
+                self.out(chr(code))
+                self.flush_out()
 
         elif self.in_vim:
             if self.print_vim:
                 if 0x21 <= code <= 0x7d:
                     sleep(0.2 * (0.5 / self.speed))
-                sys.stdout.write(chr(code))
-                sys.stdout.flush()
+                self.out(chr(code))
+                self.flush_out()
 
         else:
-            sys.stdout.write(chr(code))
+            self.out(chr(code))
 
     def execute(self, code):
         """The C0 or C1 control function should be executed, which may have any one of a variety of effects,
@@ -61,13 +65,27 @@ class VT2Output(VT500Parser.DefaultTerminalOutputHandler, VT500Parser.DefaultCon
             else:
                 if code == 0x0d: # Wait at CR, because this might be the end of the command input
                     sleep(0.8)
-                sys.stdout.write(chr(code))
+                self.out(chr(code))
                 sleep(0.1 * (1.0/self.speed))
-                sys.stdout.flush()
+                self.flush_out()
         elif self.in_vim and not self.print_vim:
             pass
         else:
-            sys.stdout.write(chr(code))
+            self.out(chr(code))
+            if code == 0x0a:
+                # Hand over every complete line, so that a terminal shows the output as it comes
+                self.write_out()
+
+    def write_out(self):
+        """ Write the collected output to stdout. """
+        if self.out_buf:
+            sys.stdout.write(''.join(self.out_buf))
+            self.out_buf.clear()
+
+    def flush_out(self):
+        """ Write the collected output to stdout and flush it. """
+        self.write_out()
+        sys.stdout.flush()
 
     def esc_dispatch(self, intermediate, final):
         """Execute all control sequences"""
@@ -75,7 +93,7 @@ class VT2Output(VT500Parser.DefaultTerminalOutputHandler, VT500Parser.DefaultCon
             return
         ctrlstring = f"\x1b{intermediate}{final}"
         LOG.info("Emit to stdout full ESC control function: %s", ctrlstring)
-        sys.stdout.write(ctrlstring)
+        self.out(ctrlstring)
 
     def csi_dispatch(self, private, param, interm, final):
         """Only certain control sequences are caught an discarded. Namely the ones that would trigger
@@ -96,17 +114,17 @@ class VT2Output(VT500Parser.DefaultTerminalOutputHandler, VT500Parser.DefaultCon
                 self.build_cmd_line_csi(private, param, interm, final)
             else:
                 sleep(0.1 * (1.0/self.speed))
-                sys.stdout.write(ctrlstring)
-                sys.stdout.flush()
+                self.out(ctrlstring)
+                self.flush_out()
         elif self.in_vim and not self.print_vim:
             pass
         else:
-            sys.stdout.write(ctrlstring)
+            self.out(ctrlstring)
 
 
     def build_cmd_line_print(self, code):
         if self.cmd_line_pos >= len(self.command_line):
-            self.command_line.insert(self.cmd_line_pos, code)
+            self.command_line.append(code)
         else:
             self.command_line[self.cmd_line_pos] = code
         self.cmd_line_pos += 1
@@ -118,7 +136,7 @@ class VT2Output(VT500Parser.DefaultTerminalOutputHandler, VT500Parser.DefaultCon
             self.cmd_line_pos = 0  # Back to start of line
         elif code == 0x0A:  # LF
             # This should terminate the command line. Add it so it gets printed.
-            self.command_line.insert(len(self.command_line), code)
+            self.command_line.append(code)
             self.cmd_line_pos +=1
 
         # Everything else is discarded, as we do not need it to build the command line
@@ -149,21 +167,21 @@ class VT2Output(VT500Parser.DefaultTerminalOutputHandler, VT500Parser.DefaultCon
         # Start with the prompt and pause
         i = self.command_line.index(ord(' '))
         for code in self.command_line[:i+1]:
-            sys.stdout.write(chr(code))
-        sys.stdout.flush()
+            self.out(chr(code))
+        self.flush_out()
         sleep(0.8)
 
         for code in self.command_line[i+1:]:
             if code == 0x0A:
                 # Pause before we end the line
                 sleep(0.8)
-            sys.stdout.write(chr(code))
+            self.out(chr(code))
             sleep(0.2 * (1.0/self.speed))
-            sys.stdout.flush()
+            self.flush_out()
 
     def prompt_active(self):
         if not self.cleanup_cmdline:
-            sys.stdout.flush()
+            self.flush_out()
             sleep(0.8)
         self.in_prompt = True
         self.command_line = []
@@ -172,7 +190,7 @@ class VT2Output(VT500Parser.DefaultTerminalOutputHandler, VT500Parser.DefaultCon
     def prompt_end(self):
         if self.cleanup_cmdline:
             self.print_cmd_line()
-        sys.stdout.flush()
+        self.flush_out()
         self.in_prompt = False
 
     def vim_start(self):
@@ -190,10 +208,11 @@ def parse(logfile):
     parser.control_sequence_handler = output_processor
     parser.tlp_event_listener = output_processor
 
-    line = logfile.readline()
-    while line:
-        parser.parse(line)
-        line = logfile.readline()
+    try:
+        for line in logfile:
+            parser.parse(line)
+    finally:
+        output_processor.flush_out()
 
     # Gather statistics and dump to log
     parser.log_statistics()
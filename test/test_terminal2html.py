@@ -0,0 +1,66 @@
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from terminal2html import parse, HopTarget
+
+RESOURCES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources')
+
+
+class HtmlOutput(io.StringIO):
+    """ Keep the HTML document readable after the converter closes its output file """
+    def close(self):
+        pass
+
+
+class TestHtmlOutput(unittest.TestCase):
+
+    def convert(self, logname, **options):
+        out = HtmlOutput()
+        with open(os.path.join(RESOURCES, logname), 'rb') as logfile:
+            parse(logfile, out, **options)
+        return out.getvalue()
+
+    def expected(self, resultname):
+        with open(os.path.join(RESOURCES, resultname), encoding='utf-8', newline='') as result:
+            return result.read()
+
+    def test_default_options(self):
+        self.assertEqual(self.convert('testtermlog_2.log'), self.expected('result_testtermlog_2.html'))
+
+    def test_chapters_filter_and_hops(self):
+        hopto = {'hops': [2, 3, 4, 8], 'target': HopTarget('x', 'next.html', [1, 4]),
+                 'pre': 'Now', 'to': 'next', 'post': '<here>'}
+        html = self.convert('session_linux_1.log', title='T', chapters={'3': 'A chapter'}, cmd_filter=[2, 5],
+                            hopto=hopto, review=True)
+        self.assertEqual(html, self.expected('result_session_linux_1.html'))
+
+
+class TestHopTarget(unittest.TestCase):
+
+    def setUp(self):
+        self.target = HopTarget('next', 'next.html', [3, 7])
+
+    def test_target_anchor(self):
+        self.assertEqual(self.target.get_target('5'), 'next.html#c5')
+
+    def test_cmd_before_filtered(self):
+        self.assertEqual(self.target.get_target_cmd(2), '2')
+
+    def test_cmd_between_filtered(self):
+        self.assertEqual(self.target.get_target_cmd(5), '4')
+
+    def test_cmd_after_filtered(self):
+        self.assertEqual(self.target.get_target_cmd(9), '7')
+
+    def test_cmd_on_filtered(self):
+        # A filtered command counts as filtered before it
+        self.assertEqual(self.target.get_target_cmd(3), '2')
+        self.assertEqual(self.target.get_target_cmd(7), '5')
+
+
+if __name__ == '__main__':
+    unittest.main()
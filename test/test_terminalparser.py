@@ -0,0 +1,46 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from terminalparser import TermLogParser
+
+
+class EventRecorder(TermLogParser.DefaultEventListener):
+    """ Record the vim events emitted by the parser """
+    def __init__(self):
+        self.events = []
+
+    def vim_start(self, ev_props):
+        self.events.append('vim_start')
+
+    def vim_end(self):
+        self.events.append('vim_end')
+
+
+class TestVimSessions(unittest.TestCase):
+
+    # A git induced vim session on a single line: window title push, edit, window title pop
+    VIM_SESSION = TermLogParser.VIM_START + b"\x1b[22;0;0t\x1b[22;2t\x1b[22;1tedit\x1b[23;0;0t"
+
+    def parse_lines(self, lines):
+        parser = TermLogParser()
+        recorder = EventRecorder()
+        parser.tlp_event_listener = recorder
+        for line in lines:
+            parser.parse(line)
+        return recorder.events
+
+    def test_single_session_in_line(self):
+        events = self.parse_lines([self.VIM_SESSION + b"\r\n", b"done\r\n"])
+        self.assertEqual(events, ['vim_start', 'vim_end'])
+
+    def test_back_to_back_sessions_in_line(self):
+        # The second session starts directly after the 23;0;0t that ends the first, like with git rebase -i
+        events = self.parse_lines([self.VIM_SESSION + self.VIM_SESSION + b"\r\n", b"done\r\n"])
+        self.assertEqual(events, ['vim_start', 'vim_end', 'vim_start', 'vim_end'])
+
+
+if __name__ == '__main__':
+    unittest.main()
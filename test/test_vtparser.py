@@ -0,0 +1,50 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vtparser import VT500Parser
+
+
+class SequenceRecorder(VT500Parser.DefaultControlSequenceHandler):
+    """ Record the escape and control sequences dispatched by the parser """
+    def __init__(self):
+        self.sequences = []
+
+    def esc_dispatch(self, intermediate, final_code):
+        self.sequences.append(('esc', intermediate, final_code))
+
+    def csi_dispatch(self, private_marker, parameters, intermediate, final_code):
+        self.sequences.append(('csi', private_marker, parameters, intermediate, final_code))
+
+
+class TestSequenceDispatch(unittest.TestCase):
+
+    def feed(self, data):
+        parser = VT500Parser()
+        recorder = SequenceRecorder()
+        parser.control_sequence_handler = recorder
+        parser.feed(data)
+        return recorder.sequences
+
+    def test_csi_parameters(self):
+        self.assertEqual(self.feed(b"\x1b[1;31m"), [('csi', '', '1;31', '', 'm')])
+
+    def test_gr_parameters(self):
+        # GR codes outside the ground state act like their GL counterparts but are stored as they came in
+        self.assertEqual(self.feed(b"\x1b[\xb1;\xb2m"), [('csi', '', '\xb1;\xb2', '', 'm')])
+
+    def test_gr_intermediate(self):
+        self.assertEqual(self.feed(b"\x1b\xa1A"), [('esc', '\xa1', 'A')])
+
+    def test_private_marker(self):
+        self.assertEqual(self.feed(b"\x1b[?25h"), [('csi', '?', '25', '', 'h')])
+
+    def test_gr_private_marker(self):
+        # The GR counterparts of the private markers are collected as intermediate characters
+        self.assertEqual(self.feed(b"\x1b[\xbc1m"), [('csi', '', '1', '\xbc', 'm')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,11 @@
 import sys
 import logging
-import json
 import time
 from os.path import dirname, exists, realpath
 from os import makedirs
 
+from jsonloader import json_loads
+
 
 LOG = logging.getLogger()
 
@@ -20,7 +21,7 @@ class ANLog:
     def start(self, ref_ts):
         self.start_ts = float(ref_ts)
         line = self.fh.readline()
-        self.frame = json.loads(line)
+        self.frame = json_loads(line)
         self.curr_ts = self.start_ts + self.frame[0]
 
     def skip_to(self, stop_ts):
@@ -28,7 +29,7 @@ class ANLog:
             self.last_frame_ts = self.frame[0]
             line = self.fh.readline()
             if line:
-                self.frame = json.loads(line)
+                self.frame = json_loads(line)
                 self.curr_ts = self.start_ts + self.frame[0]
             else:
                 self.curr_ts = float('Infinity')
@@ -55,14 +56,14 @@ class Hops:
 
 def parse(leftfile, rightfile):
     line = leftfile.readline()
-    asciinfo = json.loads(line)
+    asciinfo = json_loads(line)
     if not asciinfo.get('version') == 2:
         print("First asciinema file is not a version 2 recording. Cannot parse this file.")
         exit()
     left = ANLog(asciinfo, leftfile)
 
     line = rightfile.readline()
-    asciinfo = json.loads(line)
+    asciinfo = json_loads(line)
     if not asciinfo.get('version') == 2:
         print("Second asciinema file is not a version 2 recording. Cannot parse this file.")
         exit()
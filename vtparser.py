@@ -1,48 +1,54 @@
 import logging
+import re
 import sys
-from enum import Enum
+from enum import Enum, IntEnum
 
 LOG = logging.getLogger('vtparser')
 LOG_TRACE = 5
 
-class States(Enum):
+# Size of the chunks in which a log file is read, instead of reading it byte by byte.
+READ_CHUNK_SIZE = 128 * 1024
+
+class States(IntEnum):
     """
     VT500 Parser state machine state ids.
     """
-    GROUND = 'ground'
-    ESCAPE = 'escape'
-    ESCAPE_INTERMEDIATE = 'escape_intermediate'
-    CSI_ENTRY = 'csi_entry'
-    CSI_PARAM = 'csi_param'
-    CSI_INTERMEDIATE = 'csi_intermediate'
-    CSI_IGNORE = 'csi_ignore'
-    DCS_ENTRY = 'dcs_entry'
-    DCS_PARAM = 'dcs_param'
-    DCS_INTERMEDIATE = 'dcs_intermediate'
-    DCS_PASSTHROUGH = 'dcs_passthrough'
-    DCS_IGNORE = 'dcs_ignore'
-    OSC_STRING = 'osc_string'
-    SOS_PM_APC_STRING = 'sos_pm_apc_string'
-
-
-class Actions(Enum):
+    GROUND = 0
+    ESCAPE = 1
+    ESCAPE_INTERMEDIATE = 2
+    CSI_ENTRY = 3
+    CSI_PARAM = 4
+    CSI_INTERMEDIATE = 5
+    CSI_IGNORE = 6
+    DCS_ENTRY = 7
+    DCS_PARAM = 8
+    DCS_INTERMEDIATE = 9
+    DCS_PASSTHROUGH = 10
+    DCS_IGNORE = 11
+    OSC_STRING = 12
+    SOS_PM_APC_STRING = 13
+
+
+class Actions(IntEnum):
     """
-    Vt500 parser state machine action ids.
+    Vt500 parser state machine action ids. The lower case name of an action is the name of the parser
+     method implementing it.
     """
-    IGNORE = 'ignore'
-    PRINT = 'print'
-    EXECUTE = 'execute'
-    CLEAR = 'clear'
-    COLLECT = 'collect'
-    PARAM = 'param'
-    ESC_DISPATCH = 'esc_dispatch'
-    CSI_DISPATCH = 'csi_dispatch'
-    HOOK = 'hook'
-    PUT = 'put'
-    UNHOOK = 'unhook'
-    OSC_START = 'osc_start'
-    OSC_PUT = 'osc_put'
-    OSC_END = 'osc_end'
+    IGNORE = 0
+    PRINT = 1
+    EXECUTE = 2
+    CLEAR = 3
+    COLLECT = 4
+    PARAM = 5
+    ESC_DISPATCH = 6
+    CSI_DISPATCH = 7
+    HOOK = 8
+    PUT = 9
+    UNHOOK = 10
+    OSC_START = 11
+    OSC_PUT = 12
+    OSC_END = 13
+    COLLECT_PRIVATE = 14
 
 
 class Utf8StateMachine:
@@ -82,7 +88,7 @@ class Utf8StateMachine:
                 self.state = self.State.ACCEPT
             elif code < 0xc2 or code > 0xfd:
                 # Anything but a multibyte start byte is accepted as it is
-                LOG.debug("8-bit code seen in UTF-8 parser: 0x{:02x}. Accepted as normal code.", code)
+                LOG.debug("8-bit code seen in UTF-8 parser: 0x%02x. Accepted as normal code.", code)
                 self.uic = code
                 self.state = self.State.ACCEPT
             elif (code & 0xE0) == 0xC0:
@@ -126,7 +132,7 @@ class Utf8StateMachine:
                 self.state = self.State.INVALID
 
         else:
-            raise NotImplementedError("Not implemented state '%s'".format(self.state))
+            raise NotImplementedError("Not implemented state '{}'".format(self.state))
 
         return self.state
 
@@ -143,7 +149,12 @@ class State:
     VT500Parser state machine state. It defines a mapping from an input code to a action and/or new state
     for each defined state of the state machine.
     """
-    states = {}
+    # The generated states, indexed by state id
+    states = [None] * len(States)
+    # The C0 control codes that are not handled by the default entries of every state
+    C0_CODES = ((0x00, 0x17), 0x19, (0x1C, 0x1F))
+    # The parameter characters, digits and the semicolon separator
+    PARAM_CODES = ((0x30, 0x39), 0x3B)
 
 
     def __init__(self, state_id: States):
@@ -186,19 +197,52 @@ class State:
             # The Operating System Command control function always starts a new OSC string
             0x9D: (None, States.OSC_STRING)
         }
+        # Flat lookup table with the resolved (action, state) tuple for each byte code 0x00-0xFF.
+        # It is built from the event map once all states are known, so that an event for a
+        # byte code is a single list index instead of searching through the code ranges.
+        self.event_table = None
+        # The entry and exit actions from the event map, looked up once for use on every transition
+        self.entry_action = None
+        self.exit_action = None
 
 
     @classmethod
     def get(cls, state_id):
-        if state_id in cls.states:
-            return cls.states[state_id]
+        state = cls.states[state_id]
+        if state is not None:
+            return state
         else:
             state = State.generate_state(state_id)
+            # Register the state before building its table, since the table refers to
+            # the states it transitions to, which may in turn refer back to this one.
             cls.states[state_id] = state
+            state.build_event_table()
+            state.entry_action = state.entry()
+            state.exit_action = state.exit()
             return state
 
 
+    def build_event_table(self):
+        table = []
+        for code in range(0x100):
+            try:
+                table.append(self.lookup_event(code))
+            except NotImplementedError:
+                # No mapping for this code. Left to lookup_event to report when it occurs.
+                table.append(None)
+        self.event_table = table
+
+
     def event(self, code):
+        if code < 0x100:
+            entry = self.event_table[code]
+            if entry is not None:
+                return entry
+        return self.lookup_event(code)
+
+
+    def lookup_event(self, code):
+        """Search the event map for the (action, state) entry of an input code."""
         entry = None
 
         if self.accept_utf8:
@@ -243,14 +287,18 @@ class State:
         return None
 
 
+    def map_codes(self, codes, action, state_id=None):
+        """Map each of the codes or code ranges to the same (action, state) entry."""
+        for key in codes:
+            self.event_map[key] = (action, state_id)
+
+
     @staticmethod
     def generate_state(state_id):
         if state_id == States.GROUND:
             state = State(state_id)
             state.accept_utf8 = True
-            state.event_map[(0x00, 0x17)] = (Actions.EXECUTE, None)
-            state.event_map[0x19]         = (Actions.EXECUTE, None)
-            state.event_map[(0x1C, 0x1F)] = (Actions.EXECUTE, None)
+            state.map_codes(State.C0_CODES, Actions.EXECUTE)
 
             state.event_map[(0x20, 0x7F)] = (Actions.PRINT, None)
             state.event_map[(0xA0, 0x10FFFF)] = (Actions.PRINT, None)
@@ -260,9 +308,7 @@ class State:
             state = State(state_id)
             state.event_map['entry'] = (Actions.CLEAR,)
 
-            state.event_map[(0x00, 0x17)] = (Actions.EXECUTE, None)
-            state.event_map[0x19]         = (Actions.EXECUTE, None)
-            state.event_map[(0x1C, 0x1F)] = (Actions.EXECUTE, None)
+            state.map_codes(State.C0_CODES, Actions.EXECUTE)
 
             state.event_map[(0x20, 0x2F)] = (Actions.COLLECT, States.ESCAPE_INTERMEDIATE)
 
@@ -286,9 +332,7 @@ class State:
 
         if state_id == States.ESCAPE_INTERMEDIATE:
             state = State(state_id)
-            state.event_map[(0x00, 0x17)] = (Actions.EXECUTE, None)
-            state.event_map[0x19]         = (Actions.EXECUTE, None)
-            state.event_map[(0x1C, 0x1F)] = (Actions.EXECUTE, None)
+            state.map_codes(State.C0_CODES, Actions.EXECUTE)
 
             state.event_map[(0x20, 0x2F)] = (Actions.COLLECT, None)
 
@@ -301,16 +345,13 @@ class State:
             state = State(state_id)
             state.event_map['entry'] = (Actions.CLEAR,)
 
-            state.event_map[(0x00, 0x17)] = (Actions.EXECUTE, None)
-            state.event_map[0x19]         = (Actions.EXECUTE, None)
-            state.event_map[(0x1C, 0x1F)] = (Actions.EXECUTE, None)
+            state.map_codes(State.C0_CODES, Actions.EXECUTE)
 
             state.event_map[(0x20, 0x2F)] = (Actions.COLLECT, States.CSI_INTERMEDIATE)
 
-            state.event_map[(0x30, 0x39)] = (Actions.PARAM, States.CSI_PARAM)
-            state.event_map[0x3B]         = (Actions.PARAM, States.CSI_PARAM)
+            state.map_codes(State.PARAM_CODES, Actions.PARAM, States.CSI_PARAM)
 
-            state.event_map[(0x3C, 0x3F)] = (Actions.COLLECT, States.CSI_PARAM)
+            state.event_map[(0x3C, 0x3F)] = (Actions.COLLECT_PRIVATE, States.CSI_PARAM)
 
             state.event_map[0x3A]         = (None, States.CSI_IGNORE)
 
@@ -321,14 +362,11 @@ class State:
 
         if state_id == States.CSI_PARAM:
             state = State(state_id)
-            state.event_map[(0x00, 0x17)] = (Actions.EXECUTE, None)
-            state.event_map[0x19]         = (Actions.EXECUTE, None)
-            state.event_map[(0x1C, 0x1F)] = (Actions.EXECUTE, None)
+            state.map_codes(State.C0_CODES, Actions.EXECUTE)
 
             state.event_map[(0x20, 0x2F)] = (Actions.COLLECT, States.CSI_INTERMEDIATE)
 
-            state.event_map[(0x30, 0x39)] = (Actions.PARAM, None)
-            state.event_map[0x3B]         = (Actions.PARAM, None)
+            state.map_codes(State.PARAM_CODES, Actions.PARAM)
 
             state.event_map[0x3A]         = (None, States.CSI_IGNORE)
             state.event_map[(0x3C, 0x3F)] = (None, States.CSI_IGNORE)
@@ -340,9 +378,7 @@ class State:
 
         if state_id == States.CSI_INTERMEDIATE:
             state = State(state_id)
-            state.event_map[(0x00, 0x17)] = (Actions.EXECUTE, None)
-            state.event_map[0x19]         = (Actions.EXECUTE, None)
-            state.event_map[(0x1C, 0x1F)] = (Actions.EXECUTE, None)
+            state.map_codes(State.C0_CODES, Actions.EXECUTE)
 
             state.event_map[(0x20, 0x2F)] = (Actions.COLLECT, None)
 
@@ -355,9 +391,7 @@ class State:
 
         if state_id == States.CSI_IGNORE:
             state = State(state_id)
-            state.event_map[(0x00, 0x17)] = (Actions.EXECUTE, None)
-            state.event_map[0x19]         = (Actions.EXECUTE, None)
-            state.event_map[(0x1C, 0x1F)] = (Actions.EXECUTE, None)
+            state.map_codes(State.C0_CODES, Actions.EXECUTE)
 
             state.event_map[(0x20, 0x3F)] = (Actions.IGNORE, None)
 
@@ -370,16 +404,13 @@ class State:
             state = State(state_id)
             state.event_map['entry'] = (Actions.CLEAR,)
 
-            state.event_map[(0x00, 0x17)] = (Actions.IGNORE, None)
-            state.event_map[0x19]         = (Actions.IGNORE, None)
-            state.event_map[(0x1C, 0x1F)] = (Actions.IGNORE, None)
+            state.map_codes(State.C0_CODES, Actions.IGNORE)
 
             state.event_map[(0x20, 0x2F)] = (Actions.COLLECT, States.DCS_INTERMEDIATE)
 
-            state.event_map[(0x30, 0x39)] = (Actions.PARAM, States.DCS_PARAM)
-            state.event_map[0x3B]         = (Actions.PARAM, States.DCS_PARAM)
+            state.map_codes(State.PARAM_CODES, Actions.PARAM, States.DCS_PARAM)
 
-            state.event_map[(0x3C, 0x3F)] = (Actions.COLLECT, States.DCS_PARAM)
+            state.event_map[(0x3C, 0x3F)] = (Actions.COLLECT_PRIVATE, States.DCS_PARAM)
 
             state.event_map[0x3A]         = (None, States.DCS_IGNORE)
 
@@ -390,14 +421,11 @@ class State:
 
         if state_id == States.DCS_PARAM:
             state = State(state_id)
-            state.event_map[(0x00, 0x17)] = (Actions.IGNORE, None)
-            state.event_map[0x19]         = (Actions.IGNORE, None)
-            state.event_map[(0x1C, 0x1F)] = (Actions.IGNORE, None)
+            state.map_codes(State.C0_CODES, Actions.IGNORE)
 
             state.event_map[(0x20, 0x2F)] = (Actions.COLLECT, States.DCS_INTERMEDIATE)
 
-            state.event_map[(0x30, 0x39)] = (Actions.PARAM, None)
-            state.event_map[0x3B]         = (Actions.PARAM, None)
+            state.map_codes(State.PARAM_CODES, Actions.PARAM)
 
             state.event_map[0x3A]         = (None, States.DCS_IGNORE)
             state.event_map[(0x3C, 0x3F)] = (None, States.DCS_IGNORE)
@@ -409,9 +437,7 @@ class State:
 
         if state_id == States.DCS_INTERMEDIATE:
             state = State(state_id)
-            state.event_map[(0x00, 0x17)] = (Actions.IGNORE, None)
-            state.event_map[0x19]         = (Actions.IGNORE, None)
-            state.event_map[(0x1C, 0x1F)] = (Actions.IGNORE, None)
+            state.map_codes(State.C0_CODES, Actions.IGNORE)
 
             state.event_map[(0x20, 0x2F)] = (Actions.COLLECT, None)
 
@@ -426,9 +452,7 @@ class State:
             state = State(state_id)
             state.event_map['entry'] = (Actions.HOOK,)
 
-            state.event_map[(0x00, 0x17)] = (Actions.PUT, None)
-            state.event_map[0x19]         = (Actions.PUT, None)
-            state.event_map[(0x1C, 0x1F)] = (Actions.PUT, None)
+            state.map_codes(State.C0_CODES, Actions.PUT)
             state.event_map[(0x20, 0x7E)] = (Actions.PUT, None)
 
             state.event_map[0x7F]         = (Actions.IGNORE, None)
@@ -440,9 +464,7 @@ class State:
             state = State(state_id)
             state.event_map['entry'] = (Actions.HOOK,)
 
-            state.event_map[(0x00, 0x17)] = (Actions.IGNORE, None)
-            state.event_map[0x19]         = (Actions.IGNORE, None)
-            state.event_map[(0x1C, 0x1F)] = (Actions.IGNORE, None)
+            state.map_codes(State.C0_CODES, Actions.IGNORE)
             state.event_map[(0x20, 0x7F)] = (Actions.IGNORE, None)
             return state
 
@@ -466,9 +488,7 @@ class State:
 
         if state_id == States.SOS_PM_APC_STRING:
             state = State(state_id)
-            state.event_map[(0x00, 0x17)] = (Actions.IGNORE, None)
-            state.event_map[0x19]         = (Actions.IGNORE, None)
-            state.event_map[(0x1C, 0x1F)] = (Actions.IGNORE, None)
+            state.map_codes(State.C0_CODES, Actions.IGNORE)
             state.event_map[(0x20, 0x7F)] = (Actions.IGNORE, None)
             return state
 
@@ -481,6 +501,12 @@ class VT500Parser:
     """An implementation of a state machine for a parser for escape and control sequences,
      suitable for use in a VT emulator. Modeled after https://vt100.net/emu/dec_ansi_parser"""
 
+    # A run of printable ASCII characters. In the ground state these only trigger the print action.
+    RE_PRINTABLE_RUN = re.compile(b"[\x20-\x7E]+")
+    # The UTF-8 state machine states in which a multibyte sequence is incomplete
+    UTF8_SEQUENCE_STATES = (Utf8StateMachine.State.EXPECT_1, Utf8StateMachine.State.EXPECT_2,
+                            Utf8StateMachine.State.EXPECT_3)
+
     # Default NOP implementation of a terminal driver concerned with how codes are to be displayed
     class DefaultTerminalOutputHandler:
         def print(self, code):
@@ -537,8 +563,13 @@ class VT500Parser:
         self.intermediate_char = ''
         self.final_char = ''
         self.parameter_string = ''
+        # Parameter and intermediate characters are collected as bytes and only decoded when a sequence is dispatched
+        self.parameter_buffer = bytearray()
+        self.intermediate_buffer = bytearray()
 
-        self.state = State.get(States.GROUND)
+        # The ground state is kept at hand, as most of the input is printed in it
+        self.ground_state = State.get(States.GROUND)
+        self.state = self.ground_state
 
         # Device control string. Buffered for statistics, because we can.
         self.device_control_string = ''
@@ -558,20 +589,28 @@ class VT500Parser:
         self.device_control_strings = set()
         self.os_commands = set()
 
+        # Per-byte log output is costly even when it is filtered out, so the log levels are checked once here
+        self.trace = LOG.isEnabledFor(LOG_TRACE)
+        self.debug = LOG.isEnabledFor(logging.DEBUG)
+
+        # Bound methods of the actions, looked up once instead of by name for every action performed
+        self.action_methods = {action: getattr(self, action.name.lower(), self.default_action) for action in Actions}
+
     def perform_action(self, action, code):
         if action is None:
             return
 
-        LOG.log(LOG_TRACE, "{:02x} -> run action {}".format(code, action))
-        method = getattr(self, action.value, self.default_action)
-        method(code)
+        if self.trace:
+            LOG.log(LOG_TRACE, "%02x -> run action %s", code, action)
+        self.action_methods[action](code)
         self.stats_dict_inc(self.actions_performed, action)
 
     def default_action(self, code=None):
         LOG.warning("ENCOUNTERED AN UNIMPLEMENTED ACTION")
 
     def transition_to(self, new_state):
-        LOG.debug("Entering new state %s", new_state.id)
+        if self.debug:
+            LOG.debug("Entering new state %s", new_state.id.name)
         self.state = new_state
         self.stats_dict_inc(self.states_visited, self.state.id)
 
@@ -588,13 +627,14 @@ class VT500Parser:
                 # We could get the replacement character here but then we still have to deal with
                 # the code that just came in. Instead, we drop the invalid sequence and continue
                 # with the current code.
-                LOG.warning("An invalid UTF-8 sequence occurred. Dropping sequence and continuing with current code 0x{:02x}", code)
+                LOG.warning("An invalid UTF-8 sequence occurred. Dropping sequence and continuing with current code 0x%02x", code)
             else:
                 # Need more input
                 return
 
         # Send event to state
-        LOG.log(LOG_TRACE, "> %02x %s", code, "("+chr(code)+")" if (0x20 <= code <= 0x7E or 0xA0 < code) else '')
+        if self.trace:
+            LOG.log(LOG_TRACE, "> %02x %s", code, "("+chr(code)+")" if (0x20 <= code <= 0x7E or 0xA0 < code) else '')
         action, new_state = self.state.event(code)
 
         # If a new state is returned,
@@ -602,16 +642,47 @@ class VT500Parser:
         #  - run transition action, if any
         #  - set current state to new state
         #  - run entry action of new event, if any
-        if isinstance(new_state, State):
-            self.perform_action(self.state.exit(), code)
+        if new_state is not None:
+            self.perform_action(self.state.exit_action, code)
             self.perform_action(action, code)
             self.transition_to(new_state)
-            self.perform_action(self.state.entry(), code)
+            self.perform_action(new_state.entry_action, code)
 
         # If only an action was returned, execute the action
         elif action is not None:
             self.perform_action(action, code)
 
+    def feed(self, data: bytes):
+        """Input a chunk of bytes. Runs of printable ASCII characters in the ground state are handed to
+         the print action directly, instead of sending each of them through the state machine."""
+        pos = 0
+        end = len(data)
+        while pos < end:
+            pos = self.print_run(data, pos)
+            if pos < end:
+                self.input(data[pos])
+                pos += 1
+
+    def print_run(self, data: bytes, pos: int, end: int = None) -> int:
+        """Print the run of printable ASCII characters in data starting at pos, up to end at most, if the parser
+         is in the ground state and not inside a UTF-8 sequence. Returns the position after the run, which is
+         pos if nothing was printed."""
+        if self.state is not self.ground_state or self.utf8_stm.state in self.UTF8_SEQUENCE_STATES:
+            return pos
+        match = self.RE_PRINTABLE_RUN.match(data, pos, len(data) if end is None else end)
+        if match is None:
+            return pos
+
+        run_end = match.end()
+        print_code = self.print
+        for code in data[pos:run_end]:
+            print_code(code)
+        # Leave the UTF-8 state machine and the statistics as if the run went through input()
+        self.utf8_stm.state = Utf8StateMachine.State.ACCEPT
+        self.utf8_stm.uic = data[run_end - 1]
+        self.actions_performed[Actions.PRINT] = self.actions_performed.get(Actions.PRINT, 0) + run_end - pos
+        return run_end
+
     # Implementation of the Actions
     def ignore(self, code=None):
         """The character or control is not processed.
@@ -640,44 +711,55 @@ class VT500Parser:
         self.intermediate_char = ''
         self.final_char = ''
         self.parameter_string = ''
+        self.parameter_buffer.clear()
+        self.intermediate_buffer.clear()
 
     def collect(self, code):
-        """The private marker or intermediate character should be stored for later use in selecting
+        """The intermediate character should be stored for later use in selecting
          a control function to be executed when a final character arrives. """
-        # We want to differentiate between private markers and
-        # intermediate characters. Not sure why.
-        if 0x3c <= code <= 0x3f:
+        self.intermediate_buffer.append(code)
+
+    def collect_private(self, code):
+        """The private marker should be stored for later use in selecting a control function to be executed
+         when a final character arrives. The state machine only maps the private marker codes 3C-3F to this
+         action. Their GR counterparts BC-BF arrive here as well and are kept as intermediate characters."""
+        if code <= 0x3f:
             self.private_flag = chr(code)
         else:
-            self.intermediate_char += chr(code)
+            self.intermediate_buffer.append(code)
 
     def param(self, code):
         """This action collects the characters of a parameter string for a control sequence or device control sequence
          and builds a list of parameters. The characters processed by this action are the digits 0-9 (codes 30-39) and
          the semicolon (code 3B). The semicolon separates parameters."""
-        self.parameter_string += chr(code)
+        self.parameter_buffer.append(code)
+
+    def finish_sequence(self, code):
+        """Set the final character and decode the collected parameter and intermediate characters,
+         before a sequence is dispatched."""
+        self.final_char = chr(code)
+        self.parameter_string = self.parameter_buffer.decode('latin-1')
+        self.intermediate_char = self.intermediate_buffer.decode('latin-1')
 
     def esc_dispatch(self, code):
         """The final character of an escape sequence has arrived, so determined the control function to be executed
          from the intermediate character(s) and final character, and execute it. The intermediate characters are
          available because collect stored them as they arrived."""
-        self.final_char += chr(code)
+        self.finish_sequence(code)
         self.stats_dict_inc(self.escape_sequences_seen, 'Esc' + self.private_flag + self.parameter_string
                                                         + self.intermediate_char + self.final_char)
-        LOG.debug("execute escape sequence: {}_{}".format(self.intermediate_char, self.final_char))
+        LOG.debug("execute escape sequence: %s_%s", self.intermediate_char, self.final_char)
 
         self.control_sequence_handler.esc_dispatch(self.intermediate_char, self.final_char)
 
     def csi_dispatch(self, code):
         """A final character has arrived, so determine the control function to be executed from private marker,
          intermediate character(s) and final character, and execute it, passing in the parameter list."""
-        self.final_char += chr(code)
+        self.finish_sequence(code)
         self.stats_dict_inc(self.control_sequences_seen, 'Esc[' + self.private_flag + self.parameter_string
                                                          + self.intermediate_char + self.final_char)
-        LOG.debug("determine control function from {}_{}_{}".format(self.private_flag,
-                                                                   self.intermediate_char,
-                                                                   self.final_char))
-        LOG.debug("execute with parameters: {}".format(self.parameter_string))
+        LOG.debug("determine control function from %s_%s_%s", self.private_flag, self.intermediate_char, self.final_char)
+        LOG.debug("execute with parameters: %s", self.parameter_string)
 
         self.control_sequence_handler.csi_dispatch(self.private_flag, self.parameter_string,
                                                    self.intermediate_char, self.final_char)
@@ -688,14 +770,12 @@ class VT500Parser:
          and executes it, passing in the parameter list. It also selects a handler function for the rest of the
          characters in the control string. This handler function will be called by the put action for every character
          in the control string as it arrives."""
-        self.final_char += chr(code)
+        self.finish_sequence(code)
         self.device_control_string = ''
         self.stats_dict_inc(self.device_control_functions_seen, 'EscP' + self.private_flag + self.parameter_string
                                                                 + self.intermediate_char + self.final_char)
-        LOG.debug("determine control function from {}_{}_{}".format(self.private_flag,
-                                                                   self.intermediate_char,
-                                                                   self.final_char))
-        LOG.debug("execute with parameters: {}".format(self.parameter_string))
+        LOG.debug("determine control function from %s_%s_%s", self.private_flag, self.intermediate_char, self.final_char)
+        LOG.debug("execute with parameters: %s", self.parameter_string)
         LOG.debug("Select handler function for following put actions")
 
         self.dc_string_handler = self.dc_control_handler.hook(self.private_flag, self.parameter_string,
@@ -788,12 +868,12 @@ class VT500Parser:
 
 
 def parse(logfile):
-    """Read the input file byte by byte and input the bytes to a VT500Parser instance"""
+    """Read the input file in chunks and input the bytes to a VT500Parser instance"""
     parser = VT500Parser()
-    c = logfile.read(1)
-    while c:
-        parser.input(ord(c))
-        c = logfile.read(1)
+    chunk = logfile.read(READ_CHUNK_SIZE)
+    while chunk:
+        parser.feed(chunk)
+        chunk = logfile.read(READ_CHUNK_SIZE)
 
     # Gather statistics and dump to log
     parser.log_statistics()